@@ -28,6 +28,11 @@ from wis.config import MAX_URLS_PER_TASK, EXCLUDE_EXTERNAL_LINKS
 from tools.general_utils import Recorder
 
 
+# (focus_id, platform) -> size of the visited set last read from / written to disk
+# visited sets only ever grow, so an unchanged size means there is nothing new to save
+_persisted_sizes = {}
+
+
 def get_existings_for_focus(focus_id: str) -> dict:
     visited_record_dir = os.path.join(base_directory, ".wis", "visited_record", focus_id)
     if not os.path.exists(visited_record_dir):
@@ -39,9 +44,10 @@ def get_existings_for_focus(focus_id: str) -> dict:
         file_path = os.path.join(visited_record_dir, f"{name}.pkl")
         if not os.path.exists(file_path):
             existings[name] = set()
-            continue
-        with open(file_path, "rb") as f:
-            existings[name] = pickle.load(f)
+        else:
+            with open(file_path, "rb") as f:
+                existings[name] = pickle.load(f)
+        _persisted_sizes[(focus_id, name)] = len(existings[name])
 
     return existings
 
@@ -63,19 +69,23 @@ def save_existings_for_focus(focus_id: str, existings: dict) -> None:
     def save_platform_data(platform_name: str, data: set) -> None:
         """Save data for a single platform"""
         file_path = os.path.join(visited_record_dir, f"{platform_name}.pkl")
-        with open(file_path, "wb") as f:
+        # dump to a temp file then swap it in, an interrupted save must not leave a truncated record
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "wb") as f:
             pickle.dump(data, f)
+        os.replace(tmp_path, file_path)
+        _persisted_sizes[(focus_id, platform_name)] = len(data)
         # wis_logger.debug(f"Saved {len(data)} items for platform '{platform_name}' to {file_path}")
     
     # Use thread pool to save data concurrently
     with ThreadPoolExecutor(max_workers=len(existings)) as executor:
         futures = []
         for platform_name, data in existings.items():
-            if isinstance(data, set):
+            if not isinstance(data, set):
+                wis_logger.warning(f"Skipping platform '{platform_name}' for focus {focus_id}: data is not a set")
+            elif len(data) != _persisted_sizes.get((focus_id, platform_name)):
                 future = executor.submit(save_platform_data, platform_name, data)
                 futures.append(future)
-            else:
-                wis_logger.warning(f"Skipping platform '{platform_name}' for focus {focus_id}: data is not a set")
         
         # Wait for all tasks to complete
         for future in as_completed(futures):
@@ -179,7 +189,7 @@ async def main_process(focus: dict, sources: list, crawlers: dict = {}, db_manag
     search = focus['search']
     wis_logger.debug(f'focus_id: {focus_id}, focus_point: {focuspoint}, search with: {search}')
 
-    existings = get_existings_for_focus(focus_id)
+    existings = await asyncio.to_thread(get_existings_for_focus, focus_id)
     recorder = Recorder(focus_id=focuspoint, max_urls_per_task=MAX_URLS_PER_TASK)
 
     custom_table = focus.get('custom_table').strip() if focus.get('custom_table') else None
@@ -369,7 +379,7 @@ async def main_process(focus: dict, sources: list, crawlers: dict = {}, db_manag
                     wis_logger.error(f"Error Extracting Post List: {e}")
                     continue
 
-        save_existings_for_focus(focus_id, existings)
+        await asyncio.to_thread(save_existings_for_focus, focus_id, existings)
 
         for coro in asyncio.as_completed(tasks):
             article = await coro
@@ -414,7 +424,7 @@ async def main_process(focus: dict, sources: list, crawlers: dict = {}, db_manag
                         recorder.scrap_failed += 1
                         continue
 
-            save_existings_for_focus(focus_id, existings)
+            await asyncio.to_thread(save_existings_for_focus, focus_id, existings)
             # 只保留未成功处理的 articles，失败的会在下次循环重试
             recorder.article_queue = []
             wis_logger.debug(f"[BATCH SCRAPING] ✓ finished for focus {focus_id}, time cost: {int((time.perf_counter() - t1) * 1000) / 1000:.2f}s")
@@ -16,6 +16,7 @@ from wis import (
 )
 
 from custom_processes import crawler_config_map
+from wis.config import MAX_CONCURRENT_FOCUS
 
 import asyncio
 from general_process import main_process
@@ -75,6 +76,13 @@ async def schedule_task():
             except Exception as e:
                 wis_logger.warning(f"initialize weibo crawler failed: {e}, will abort all the sources for weibo platform")
 
+    # bound how many focus points run main_process at the same time
+    focus_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FOCUS)
+
+    async def bounded_process(focus, sources):
+        async with focus_semaphore:
+            await main_process(focus, sources, crawlers, db_manager)
+
     global loop_counter
     try:
         while True:
@@ -90,7 +98,7 @@ async def schedule_task():
                     continue
                 if loop_counter % focus['freq'] != 0:
                     continue
-                jobs.append(main_process(focus, sources, crawlers, db_manager))
+                jobs.append(bounded_process(focus, sources))
             loop_counter += 1
             await asyncio.gather(*jobs)
             wis_logger.info('task execute loop finished, work after 3600 seconds')
@@ -63,11 +63,14 @@ def isChinesePunctuation(char: str) -> bool:
     return ord(char) in chinese_punctuations
 
 
+# translate table deleting CJK Unified Ideographs (\u4e00-\u9fa5)
+_CJK_DEL_TABLE = dict.fromkeys(range(0x4E00, 0x9FA6))
+
+
 def is_chinese(string: str) -> bool:
     if not string:
         return False
-    pattern = regex.compile(r'[^\u4e00-\u9fa5]')
-    non_chinese_count = len(pattern.findall(string))
+    non_chinese_count = len(string.translate(_CJK_DEL_TABLE))
     return (non_chinese_count / len(string)) < 0.68
 
 
@@ -91,18 +94,21 @@ def extract_and_convert_dates(input_string: str) -> str:
     return ''
 
 
-# Track created logger handlers
+# Track created logger handlers: logger_name -> (logger_file, handler ids)
 _logger_handlers = {}
 
 
 def get_logger(logger_file_path: str, logger_name: str):
     verbose = os.environ.get("VERBOSE", "").lower() in ["true", "1"]
 
-    os.makedirs(logger_file_path, exist_ok=True)
     logger_file = os.path.join(logger_file_path, f"{logger_name}.log")
 
     if logger_name in _logger_handlers:
-        for handler_id in _logger_handlers[logger_name]:
+        configured_file, handler_ids = _logger_handlers[logger_name]
+        if configured_file == logger_file:
+            # sinks for this logger already installed, reuse them
+            return logger.bind(name=logger_name)
+        for handler_id in handler_ids:
             try:
                 logger.remove(handler_id)
             except ValueError:
@@ -113,6 +119,7 @@ def get_logger(logger_file_path: str, logger_name: str):
         except ValueError:
             pass
 
+    os.makedirs(logger_file_path, exist_ok=True)
     logger_filter = lambda record: record.get("extra", {}).get("name") == logger_name
 
     file_handler_id = logger.add(
@@ -134,7 +141,7 @@ def get_logger(logger_file_path: str, logger_name: str):
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{message}</level>"
     )
 
-    _logger_handlers[logger_name] = [file_handler_id, console_handler_id]
+    _logger_handlers[logger_name] = (logger_file, [file_handler_id, console_handler_id])
 
     if logger_name == 'wiseflow_info_scraper':
         print(f"\n{CYAN}{'#' * 50}{RESET}")
@@ -8,6 +8,10 @@ VIEWPORT_HEIGHT = 768
 # make it bigger, you got more handling speed but can got more memory usage and more possiblity of read time out
 # 6 is safe
 MaxSessionPermit = 6
+# how many focus points can be processed at the same time
+# every focus drives its own source finding, crawling and llm extraction,
+# too many at once will exhaust browser sessions and llm rate limits
+MAX_CONCURRENT_FOCUS = 3
 # whether you want llm to consider external links
 # make it true, then wiseflow will never explore links outside your sources' domains
 EXCLUDE_EXTERNAL_LINKS = True
@@ -964,6 +964,10 @@ def extract_xml_data_legacy(tags, string):
 
     return data
 
+@lru_cache(maxsize=32)
+def _xml_tag_pattern(tag):
+    return re.compile(f"<{tag}>(.*?)</{tag}>", re.DOTALL)
+
 def extract_xml_data(tags, string):
     """
     Extract data for specified XML tags from a string, returning the longest content for each tag.
@@ -983,8 +987,7 @@ def extract_xml_data(tags, string):
     data = {}
 
     for tag in tags:
-        pattern = f"<{tag}>(.*?)</{tag}>"
-        matches = re.findall(pattern, string, re.DOTALL)
+        matches = _xml_tag_pattern(tag).findall(string)
         
         if matches:
             # Find the longest content for this tag